@@ -1,4 +1,5 @@
-from typing import Dict
+import inspect
+from typing import Dict, FrozenSet, Optional
 
 from lightbus.exceptions import (
     UnknownApi,
@@ -137,3 +138,17 @@ class Event:
                 f"tuple of parameter names."
             )
         self.parameters = parameters
+        self._parameter_names: Optional[FrozenSet[str]] = None
+
+    @property
+    def parameter_names(self) -> FrozenSet[str]:
+        """The names of this event's parameters
+
+        Parameters may be specified as either strings or `Parameter` objects.
+        This is checked every time an event is fired, so we calculate it once and cache it.
+        """
+        if self._parameter_names is None:
+            self._parameter_names = frozenset(
+                p.name if isinstance(p, inspect.Parameter) else p for p in self.parameters
+            )
+        return self._parameter_names
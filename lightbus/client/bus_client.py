@@ -374,13 +374,33 @@ class BusClient:
     # Events
 
     @raise_queued_errors
-    async def fire_event(self, api_name, name, kwargs: dict = None, options: dict = None):
-        """Fire an event onto the bus"""
+    async def fire_event(
+        self, api_name, name, kwargs: dict = None, options: dict = None, wait: bool = True
+    ):
+        """Fire an event onto the bus
+
+        Set `wait` to False to return once the event has been queued for sending,
+        rather than once it has been sent. See `EventClient.fire_event()`.
+        """
         await self.lazy_load_now()
         return await self.event_client.fire_event(
-            api_name=api_name, name=name, kwargs=kwargs, options=options
+            api_name=api_name, name=name, kwargs=kwargs, options=options, wait=wait
         )
 
+    @raise_queued_errors
+    async def fire_events(self, events: Sequence[Tuple[str, str, dict]], options: dict = None):
+        """Fire multiple events onto the bus in one go
+
+        `events` is in the form:
+
+            events=[
+                ('company.first_api', 'event_name', {'param': 'value'}),
+                ('company.second_api', 'event_name', {'param': 'value'}),
+            ]
+        """
+        await self.lazy_load_now()
+        return await self.event_client.fire_events(events=events, options=options)
+
     def listen_for_event(
         self,
         api_name: str,
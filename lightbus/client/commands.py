@@ -14,6 +14,11 @@ class SendEventCommand(NamedTuple):
     options: dict = {}
 
 
+class SendEventBatchCommand(NamedTuple):
+    messages: List[EventMessage]
+    options: dict = {}
+
+
 class ConsumeEventsCommand(NamedTuple):
     events: List[Tuple[str, str]]
     listener_name: str
@@ -29,15 +29,13 @@ class BaseDock:
         self.api_registry = api_registry
         self.config = config
         self.error_queue = error_queue
-        self.producer = InternalProducer(queue=produce_to, error_queue=error_queue)
+        self.producer = InternalProducer(queue=produce_to)
         self.consumer = InternalConsumer(queue=consume_from, error_queue=error_queue)
 
-        self.producer.start()
         self.consumer.start(self.handle)
 
     async def handle(self, command):
         raise NotImplementedError()
 
     async def wait_until_ready(self):
-        await self.producer.wait_until_ready()
         await self.consumer.wait_until_ready()
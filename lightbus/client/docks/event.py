@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections import defaultdict
 
 from lightbus.client.docks.base import BaseDock
 from lightbus.client.utilities import queue_exception_checker
@@ -72,6 +73,19 @@ class EventDock(BaseDock):
 
         await event_transport.send_event(event_message=command.message, options=command.options)
 
+    @handle.register
+    async def handle_send_event_batch(self, command: commands.SendEventBatchCommand):
+        # Group the messages by transport, so each transport can send all of its messages in one go
+        messages_by_transport = defaultdict(list)
+        for event_message in command.messages:
+            event_transport = self.transport_registry.get_event_transport(event_message.api_name)
+            messages_by_transport[event_transport].append(event_message)
+
+        for event_transport, event_messages in messages_by_transport.items():
+            await event_transport.send_event_batch(
+                event_messages=event_messages, options=command.options
+            )
+
     @handle.register
     async def handle_acknowledge_event(self, command: commands.AcknowledgeEventCommand):
         event_transport = self.transport_registry.get_event_transport(command.message.api_name)
@@ -85,4 +99,3 @@ class EventDock(BaseDock):
             await event_transport.close()
 
         await self.consumer.close()
-        await self.producer.close()
@@ -137,7 +137,6 @@ class RpcResultDock(BaseDock):
             await rpc_transport.close()
 
         await self.consumer.close()
-        await self.producer.close()
 
     async def _consume_rpcs_with_transport(self, rpc_transport: RpcTransport, apis: List[Api]):
         while True:
@@ -147,4 +146,4 @@ class RpcResultDock(BaseDock):
                 return
 
             for rpc_message in rpc_messages:
-                await self.producer.send(commands.ExecuteRpcCommand(message=rpc_message)).wait()
+                await self.producer.send_and_wait(commands.ExecuteRpcCommand(message=rpc_message))
@@ -1,13 +1,19 @@
 import asyncio
 import logging
-from typing import Optional, Callable
+from functools import partial
+from traceback import extract_stack, StackSummary
+from typing import Optional, Callable, Union
 
-from lightbus.client.utilities import queue_exception_checker, ErrorQueueType
+from lightbus.client.utilities import queue_exception_checker, ErrorQueueType, Error
 from lightbus.utilities.async_tools import cancel
 from lightbus.utilities.internal_queue import InternalQueue
 
 logger = logging.getLogger(__name__)
 
+# Senders can be notified of a command's completion via either
+# an Event or a Future. None indicates the sender does not wish to be notified.
+OnDone = Optional[Union[asyncio.Event, asyncio.Future]]
+
 
 # Was handler
 class InternalConsumer:
@@ -17,10 +23,15 @@ class InternalConsumer:
     consumption by the transport
     """
 
+    # The maximum number of commands to pull from the queue in one go
+    max_batch_size = 64
+
     def __init__(self, queue: InternalQueue, error_queue: ErrorQueueType):
         self._consumer_task: Optional[asyncio.Task] = None
         self._running_commands = set()
         self._ready = asyncio.Event()
+        # Where the consumer was started from. Used when reporting errors raised by handlers
+        self._invoking_stack: Optional[StackSummary] = None
         self.queue = queue
         self.error_queue = error_queue
 
@@ -33,10 +44,10 @@ class InternalConsumer:
             f"Starting consumer for handler {handler.__qualname__}(). This should report ready"
             " shortly..."
         )
+        self._invoking_stack = extract_stack()[:-1]
         self._consumer_task = asyncio.ensure_future(
             queue_exception_checker(self._consumer_loop(self.queue, handler), self.error_queue)
         )
-        self._running_commands = set()
 
     async def close(self):
         """Shutdown the invoker and cancel any currently running tasks
@@ -62,43 +73,95 @@ class InternalConsumer:
         self._ready.set()
 
         while True:
-            on_done: asyncio.Event
-            command, on_done = await queue.get()
-            self.handle_in_background(queue, handler, command, on_done)
+            # Wait for a command to arrive, then take any others which are already
+            # waiting on the queue. This means we only have to go back to the event loop
+            # once per burst of commands, rather than once per command.
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            on_done: OnDone
+            for command, on_done in batch:
+                self.handle_in_background(queue, handler, command, on_done)
 
     async def wait_until_ready(self):
         """Wait until this consumer is ready to start receiving & handling commands"""
         await self._ready.wait()
 
-    def handle_in_background(self, queue: InternalQueue, handler, command, on_done: asyncio.Event):
+    def handle_in_background(self, queue: InternalQueue, handler, command, on_done: OnDone):
         """Handle a received command by calling the provided handler
 
         This execution happens in the background.
         """
         logger.debug(f"Handling command {command}")
 
-        def when_task_finished(fut: asyncio.Future):
-            self._running_commands.remove(fut)
-            try:
-                # Retrieve any error which may have occurred.
-                # We ignore the error because we assume any exceptions which the
-                # handler threw will have already been placed into the error queue
-                # by the queue_exception_checker().
-                # Regardless, we must retrieve the result in order to keep Python happy.
-                fut.result()
-            except:
-                pass
-
-            # We use call_soon_threadsafe() to ensure we call the Event's set()
-            # in a threadsafe fashion. This is because the Event object may have
-            # been created in another thread and be attached to another event loop
-            on_done._loop.call_soon_threadsafe(on_done.set)
-
-        # fmt: off
-        background_call_task = asyncio.ensure_future(queue_exception_checker(
-            handler(command),
-            self.error_queue,
-        ))
-        # fmt: on
-        background_call_task.add_done_callback(when_task_finished)
+        # Errors are placed into the error queue by _when_task_finished(), which does the same
+        # job as queue_exception_checker() without wrapping every command in another coroutine
+        background_call_task = asyncio.ensure_future(handler(command))
+        background_call_task.add_done_callback(partial(self._when_task_finished, on_done))
         self._running_commands.add(background_call_task)
+
+    def _when_task_finished(self, on_done: OnDone, fut: asyncio.Future):
+        # Use discard() rather than remove(), as an error here would leave
+        # the sender waiting forever for the command to complete
+        self._running_commands.discard(fut)
+        try:
+            # Always retrieve the exception (if any) in order to keep Python happy
+            exception = None if fut.cancelled() else fut.exception()
+            if isinstance(exception, Exception):
+                self._queue_exception(exception)
+        finally:
+            notify_done(on_done)
+
+    def _queue_exception(self, exception: Exception):
+        """Place an exception raised by a handler into the error queue
+
+        Mirrors queue_exception_checker(), but uses the stack captured when the consumer
+        was started rather than capturing the stack for every command.
+        """
+        # The exception may have already been enqueued by a queue_exception_checker()
+        # further down the stack
+        if not getattr(exception, "enqueued", False):
+            exception.enqueued = True
+            self.error_queue.put_nowait(
+                Error(type(exception), exception, exception.__traceback__, self._invoking_stack)
+            )
+
+
+def notify_done(on_done: OnDone):
+    """Let the sender of a command know that the command has been handled
+
+    The Event/Future may have been created in another thread and be attached
+    to another event loop. In which case we use call_soon_threadsafe().
+    However, in the common case the sender is on the same loop as us, so
+    we can skip the (relatively expensive) trip through call_soon_threadsafe().
+    """
+    if on_done is None:
+        # The sender is not waiting to hear when the command is done
+        # (see InternalProducer.send_nowait())
+        return
+
+    if isinstance(on_done, asyncio.Future):
+        set_done = _set_future_done
+        on_done_loop = on_done.get_loop()
+    else:
+        # InternalProducer always sends Futures, so an Event will only come from something
+        # putting commands onto the queue directly. Such an Event's loop will be None on
+        # Python 3.10+ if nothing has waited on it yet, in which case we can only set it
+        # directly, which is only safe if the sender is in this thread.
+        set_done = asyncio.Event.set
+        on_done_loop = on_done._loop
+
+    if on_done_loop is None or on_done_loop is asyncio.get_event_loop():
+        set_done(on_done)
+    else:
+        on_done_loop.call_soon_threadsafe(set_done, on_done)
+
+
+def _set_future_done(future: asyncio.Future):
+    # The sender may have given up waiting (i.e. been cancelled)
+    if not future.done():
+        future.set_result(None)
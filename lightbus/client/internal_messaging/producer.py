@@ -29,8 +29,6 @@ import asyncio
 import logging
 from typing import Optional
 
-from lightbus.client.utilities import queue_exception_checker, ErrorQueueType
-from lightbus.utilities.async_tools import cancel
 from lightbus.utilities.internal_queue import InternalQueue
 
 logger = logging.getLogger(__name__)
@@ -47,78 +45,90 @@ class InternalProducer:
     # Warnings will be displayed if a queue grows to be equal to or greater than this size
     size_warning = 5
 
-    # How often should the queue sizes be monitored
-    monitor_interval = 0.1
-
-    def __init__(self, queue: InternalQueue, error_queue: ErrorQueueType):
+    def __init__(self, queue: InternalQueue):
         """Initialise the invoker
 
-        The callable specified by `on_exception` will be called with a single positional argument,
-        which is the exception which occurred. This should take care of shutting down the invoker,
-        as well as any other cleanup which needs to happen.
+        Commands will be placed onto the given `queue`, ready to be handled by
+        the corresponding InternalConsumer.
         """
-        self._queue_monitor_task: Optional[asyncio.Task] = None
-        self._monitor_ready = asyncio.Event()
+        # The queue size we last warned about, or None if the queue is at an OK size
+        self._reported_size: Optional[int] = None
         self.queue = queue
-        self.error_queue = error_queue
-
-    def start(self):
-        """Starts the queue monitor"""
-        # fmt: off
-        self._queue_monitor_task = asyncio.ensure_future(queue_exception_checker(
-            self._queue_monitor(),
-            self.error_queue,
-        ))
-        # fmt: on
-
-    async def close(self):
-        if self._queue_monitor_task:
-            await cancel(self._queue_monitor_task)
-            self._queue_monitor_task = None
-            self._monitor_ready = asyncio.Event()
-
-    async def wait_until_ready(self):
-        """Wait until this producer is ready to start receiving & handling commands"""
-        await self._monitor_ready.wait()
-
-    async def _queue_monitor(self):
-        """Watches queues for growth and reports errors"""
-        self._monitor_ready.set()
-
-        previous_size = None
-        while True:
-            current_size = self.queue.qsize()
-
-            show_size_warning = current_size >= self.size_warning and current_size != previous_size
-            queue_has_shrunk = (
-                previous_size is not None
-                and current_size < previous_size
-                and previous_size >= self.size_warning
-            )
 
-            if show_size_warning or queue_has_shrunk:
-                if queue_has_shrunk:
-                    if not show_size_warning:
-                        everything_ok = " Queue is now at an OK size again."
-                    else:
-                        everything_ok = ""
-
-                    logger.warning(
-                        "Queue in %s has shrunk back down to %s commands.%s",
-                        self.__class__.__name__,
-                        current_size,
-                        everything_ok,
-                    )
-                elif show_size_warning:
-                    logger.warning(
-                        "Queue in %s now has %s commands.", self.__class__.__name__, current_size
-                    )
-
-            previous_size = current_size
-            await asyncio.sleep(self.monitor_interval)
+    def _put(self, command, on_done):
+        self.queue.put_nowait((command, on_done))
+        self._check_queue_size()
+
+    def _check_queue_size(self):
+        """Log a warning if the queue has grown too large
+
+        Only the producer grows the queue, so we check the size each time we
+        put a command onto it. This avoids needing a background task to watch
+        the queue. It does mean that the queue shrinking is only reported upon
+        the next put.
+
+        Logging only happens when the size changes, to avoid lots of duplicate lines.
+        """
+        current_size = self.queue.qsize()
+        previous_size = self._reported_size
+
+        if current_size >= self.size_warning:
+            if current_size == previous_size:
+                return
+            elif previous_size is not None and current_size < previous_size:
+                logger.warning(
+                    "Queue in %s has shrunk back down to %s commands.",
+                    self.__class__.__name__,
+                    current_size,
+                )
+            else:
+                logger.warning(
+                    "Queue in %s now has %s commands.", self.__class__.__name__, current_size
+                )
+            self._reported_size = current_size
+
+        elif previous_size is not None:
+            logger.warning(
+                "Queue in %s has shrunk back down to %s commands. Queue is now at an OK size again.",
+                self.__class__.__name__,
+                current_size,
+            )
+            self._reported_size = None
 
     def send(self, command) -> asyncio.Event:
+        """Send a command, returning an Event which will be set once it has been handled
+
+        The consumer is given a Future bound to our event loop, rather than the Event
+        itself. The consumer may be in another thread, and an Event does not know its
+        loop until something waits on it (on Python 3.10+). Resolving the Future
+        ensures the Event is always set from within our own loop.
+        """
         logger.debug(f"Sending command {command}")
         event = asyncio.Event()
-        self.queue.put_nowait((command, event))
+        future = asyncio.get_event_loop().create_future()
+        future.add_done_callback(lambda _: event.set())
+        self._put(command, future)
         return event
+
+    async def send_and_wait(self, command):
+        """Send a command and wait until it has been handled
+
+        This is equivalent to `await send(command).wait()`, but uses a
+        Future rather than an Event. A Future is lighter-weight, and the
+        consumer can resolve it directly when it is on the same event
+        loop as us (which is nearly always the case).
+        """
+        logger.debug(f"Sending command {command}")
+        future = asyncio.get_event_loop().create_future()
+        self._put(command, future)
+        await future
+
+    def send_nowait(self, command):
+        """Send a command without waiting for it to be handled
+
+        No event is created for the command, so there is no way of knowing
+        when the command has been handled. Use this for commands where
+        the caller does not care.
+        """
+        logger.debug(f"Sending command {command} (not waiting)")
+        self._put(command, None)
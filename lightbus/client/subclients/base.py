@@ -26,10 +26,9 @@ class BaseSubClient:
         self.config = config
         self.schema = schema
         self.error_queue = error_queue
-        self.producer = InternalProducer(queue=produce_to, error_queue=error_queue)
+        self.producer = InternalProducer(queue=produce_to)
         self.consumer = InternalConsumer(queue=consume_from, error_queue=error_queue)
 
-        self.producer.start()
         self.consumer.start(self.handle)
 
     async def handle(self, command):
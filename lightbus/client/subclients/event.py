@@ -1,9 +1,20 @@
 import asyncio
 import inspect
 import logging
-from typing import List, Tuple, Callable, NamedTuple
+from typing import (
+    List,
+    Tuple,
+    Callable,
+    NamedTuple,
+    Dict,
+    Mapping,
+    Any,
+    Sequence,
+    Optional,
+    get_type_hints,
+)
 
-from lightbus.schema.schema import Parameter
+from lightbus.api import Api
 from lightbus.message import EventMessage
 from lightbus.client.subclients.base import BaseSubClient
 from lightbus.client.utilities import validate_event_or_rpc_name, queue_exception_checker, OnError
@@ -19,13 +30,14 @@ from lightbus.exceptions import (
 from lightbus.log import L, Bold
 from lightbus.client.commands import (
     SendEventCommand,
+    SendEventBatchCommand,
     AcknowledgeEventCommand,
     ConsumeEventsCommand,
     CloseCommand,
 )
 from lightbus.utilities.async_tools import run_user_provided_callable, cancel_and_log_exceptions
 from lightbus.utilities.internal_queue import InternalQueue
-from lightbus.utilities.casting import cast_to_signature
+from lightbus.utilities.casting import cast_to_type_hints
 from lightbus.utilities.deforming import deform_to_bus
 from lightbus.utilities.singledispatch import singledispatchmethod
 
@@ -36,11 +48,73 @@ class EventClient(BaseSubClient):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._event_listeners: List[Listener] = []
+        # Listeners indexed by (api_name, listener_name), for quick lookups
+        self._event_listeners_by_api: Dict[Tuple[str, str], Listener] = {}
+        # Type hints for each listener callable, used when casting incoming event parameters
+        self._listener_type_hints: Dict[Callable, Mapping[str, Any]] = {}
+        # Message factories for each (api_name, event_name) fired, along with the API they were built for
+        self._event_message_factories: Dict[Tuple[str, str], Tuple[Api, Callable]] = {}
         self._event_listener_tasks = set()
         self._listeners_started = False
 
-    async def fire_event(self, api_name, name, kwargs: dict = None, options: dict = None):
-        kwargs = kwargs or {}
+    async def fire_event(
+        self, api_name, name, kwargs: dict = None, options: dict = None, wait: bool = True
+    ):
+        """Fire an event
+
+        Set `wait` to False to return as soon as the event has been queued for sending,
+        rather than waiting for the event transport to send it. Any errors in sending the
+        event will still be placed into the error queue. As we do not know when the event
+        is actually sent, the `after_event_sent` hook is not executed in this case.
+        """
+        event_message = self._make_event_message(api_name, name, kwargs)
+
+        await self.hook_registry.execute("before_event_sent", event_message=event_message)
+        logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
+
+        command = SendEventCommand(message=event_message, options=options)
+        if wait:
+            await self.producer.send_and_wait(command)
+            await self.hook_registry.execute("after_event_sent", event_message=event_message)
+        else:
+            self.producer.send_nowait(command)
+
+    async def fire_events(self, events: Sequence[Tuple[str, str, dict]], options: dict = None):
+        """Fire multiple events in one go
+
+        `events` is in the form:
+
+            events=[
+                ('company.first_api', 'event_name', {'param': 'value'}),
+                ('company.second_api', 'event_name', {'param': 'value'}),
+            ]
+
+        All the events are sent to the event dock as a single command, and event
+        transports receive all their events at once (see `EventTransport.send_event_batch()`)
+        """
+        event_messages = [
+            self._make_event_message(api_name, name, kwargs) for api_name, name, kwargs in events
+        ]
+
+        for event_message in event_messages:
+            await self.hook_registry.execute("before_event_sent", event_message=event_message)
+            logger.info(
+                L(
+                    "📤  Sending event {}.{}".format(
+                        Bold(event_message.api_name), Bold(event_message.event_name)
+                    )
+                )
+            )
+
+        await self.producer.send_and_wait(
+            SendEventBatchCommand(messages=event_messages, options=options)
+        )
+
+        for event_message in event_messages:
+            await self.hook_registry.execute("after_event_sent", event_message=event_message)
+
+    def _make_event_message(self, api_name, name, kwargs: Optional[dict]) -> EventMessage:
+        """Validate an event about to be fired & create the message to send"""
         try:
             api = self.api_registry.get(api_name)
         except UnknownApi:
@@ -53,6 +127,21 @@ class EventClient(BaseSubClient):
                 "registered using bus.client.register_api(). ".format(**locals())
             )
 
+        # The API is looked up every time, as it may have been replaced in the registry
+        cached = self._event_message_factories.get((api_name, name))
+        if cached is None or cached[0] is not api:
+            cached = (api, self._build_event_message_factory(api, name))
+            self._event_message_factories[(api_name, name)] = cached
+
+        return cached[1](kwargs or {})
+
+    def _build_event_message_factory(self, api: Api, name) -> Callable[[dict], EventMessage]:
+        """Create a function which validates kwargs & creates messages for the given event
+
+        Everything which does not depend upon the event's kwargs is resolved here, once,
+        rather than every time the event is fired.
+        """
+        api_name = api.meta.name
         validate_event_or_rpc_name(api_name, "event", name)
 
         try:
@@ -64,32 +153,29 @@ class EventClient(BaseSubClient):
                 "may also be using the incorrect API. Also check for typos.".format(**locals())
             )
 
-        parameter_names = {p.name if isinstance(p, Parameter) else p for p in event.parameters}
-
-        if set(kwargs.keys()) != parameter_names:
-            raise InvalidEventArguments(
-                "Invalid event arguments supplied when firing event. Attempted to fire event with "
-                "{} arguments: {}. Event expected {}: {}".format(
-                    len(kwargs),
-                    sorted(kwargs.keys()),
-                    len(event.parameters),
-                    sorted(parameter_names),
+        parameter_names = event.parameter_names
+        parameter_count = len(event.parameters)
+        api_version = api.meta.version
+
+        def make_event_message(kwargs: dict) -> EventMessage:
+            if kwargs.keys() != parameter_names:
+                raise InvalidEventArguments(
+                    "Invalid event arguments supplied when firing event. Attempted to fire event with "
+                    "{} arguments: {}. Event expected {}: {}".format(
+                        len(kwargs), sorted(kwargs.keys()), parameter_count, sorted(parameter_names)
+                    )
                 )
-            )
 
-        kwargs = deform_to_bus(kwargs)
-        event_message = EventMessage(
-            api_name=api.meta.name, event_name=name, kwargs=kwargs, version=api.meta.version
-        )
-
-        validate_outgoing(self.config, self.schema, event_message)
-
-        await self.hook_registry.execute("before_event_sent", event_message=event_message)
-        logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
-
-        await self.producer.send(SendEventCommand(message=event_message, options=options)).wait()
+            event_message = EventMessage(
+                api_name=api_name,
+                event_name=name,
+                kwargs=deform_to_bus(kwargs),
+                version=api_version,
+            )
+            validate_outgoing(self.config, self.schema, event_message)
+            return event_message
 
-        await self.hook_registry.execute("after_event_sent", event_message=event_message)
+        return make_event_message
 
     def listen(
         self,
@@ -122,23 +208,19 @@ class EventClient(BaseSubClient):
         for api_name, name in events:
             validate_event_or_rpc_name(api_name, "event", name)
 
-        self._event_listeners.append(
-            Listener(
-                callable=listener,
-                options=options or {},
-                events=events,
-                name=listener_name,
-                on_error=on_error,
-            )
+        event_listener = Listener(
+            callable=listener,
+            options=options or {},
+            events=events,
+            name=listener_name,
+            on_error=on_error,
         )
+        self._event_listeners.append(event_listener)
+        for api_name, _ in events:
+            self._event_listeners_by_api[(api_name, listener_name)] = event_listener
 
     def get_event_listener(self, api_name: str, listener_name: str):
-        for listener in self._event_listeners:
-            if listener.name == listener_name:
-                for listener_api_name, _ in listener.events:
-                    if listener_api_name == api_name:
-                        return listener
-        return None
+        return self._event_listeners_by_api.get((api_name, listener_name))
 
     async def _on_message(
         self, event_message: EventMessage, listener: Callable, options: dict, on_error: OnError
@@ -158,7 +240,9 @@ class EventClient(BaseSubClient):
         await self.hook_registry.execute("before_event_execution", event_message=event_message)
 
         if self.config.api(event_message.api_name).cast_values:
-            parameters = cast_to_signature(parameters=event_message.kwargs, callable=listener)
+            parameters = cast_to_type_hints(
+                parameters=event_message.kwargs, type_hints=self._get_type_hints(listener)
+            )
         else:
             parameters = event_message.kwargs
 
@@ -190,19 +274,34 @@ class EventClient(BaseSubClient):
                 logger.exception(e)
 
         # Acknowledge the successfully processed message
-        await self.producer.send(
+        await self.producer.send_and_wait(
             AcknowledgeEventCommand(message=event_message, options=options)
-        ).wait()
+        )
 
         await self.hook_registry.execute("after_event_execution", event_message=event_message)
 
+    def _get_type_hints(self, listener: Callable) -> Mapping[str, Any]:
+        """Get the listener's type hints
+
+        These are fetched upon the first event the listener receives, and then reused
+        for every subsequent event, rather than being fetched for every event.
+        """
+        try:
+            return self._listener_type_hints[listener]
+        except KeyError:
+            type_hints = self._listener_type_hints[listener] = get_type_hints(listener)
+            return type_hints
+        except TypeError:
+            # The listener is unhashable (e.g. an instance of a dataclass which
+            # defines __call__), so cannot be cached
+            return get_type_hints(listener)
+
     async def close(self):
         await super().close()
         await cancel_and_log_exceptions(*self._event_listener_tasks)
-        await self.producer.send(CloseCommand()).wait()
+        await self.producer.send_and_wait(CloseCommand())
 
         await self.consumer.close()
-        await self.producer.close()
 
     @singledispatchmethod
     async def handle(self, command):
@@ -238,14 +337,14 @@ class EventClient(BaseSubClient):
         task = asyncio.ensure_future(queue_exception_checker(consume_events(), self.error_queue))
         self._event_listener_tasks.add(task)
 
-        await self.producer.send(
+        await self.producer.send_and_wait(
             ConsumeEventsCommand(
                 events=listener.events,
                 destination_queue=queue,
                 listener_name=listener.name,
                 options=listener.options,
             )
-        ).wait()
+        )
 
 
 class Listener(NamedTuple):
@@ -263,16 +362,7 @@ def sanity_check_listener(listener):
             f"than passing the function itself?"
         )
 
-    total_positional_args = 0
-    has_variable_positional_args = False  # Eg: *args
-    for parameter in inspect.signature(listener).parameters.values():
-        if parameter.kind in (
-            inspect.Parameter.POSITIONAL_ONLY,
-            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        ):
-            total_positional_args += 1
-        elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
-            has_variable_positional_args = True
+    total_positional_args, has_variable_positional_args = _get_positional_args(listener)
 
     if has_variable_positional_args:
         return
@@ -283,3 +373,37 @@ def sanity_check_listener(listener):
             f"This will be the event message. For example: "
             f"my_listener(event, other, ...)"
         )
+
+
+def _get_positional_args(listener) -> Tuple[int, bool]:
+    """Get the number of positional arguments the listener takes, and whether it takes *args
+
+    For plain functions & methods we can read this straight from the code object, which is much
+    cheaper than inspect.signature(). We fall back to inspect.signature() for everything else
+    (partials, callable objects, wrapped functions, etc).
+    """
+    is_method = inspect.ismethod(listener)
+    function = listener.__func__ if is_method else listener
+    code = getattr(function, "__code__", None)
+
+    if (
+        code is not None
+        and not hasattr(function, "__wrapped__")
+        and not hasattr(function, "__signature__")
+    ):
+        # co_argcount includes positional-only arguments, but for
+        # methods it will also include 'self', which we do not want
+        total_positional_args = code.co_argcount - (1 if is_method else 0)
+        return total_positional_args, bool(code.co_flags & inspect.CO_VARARGS)
+
+    total_positional_args = 0
+    has_variable_positional_args = False  # Eg: *args
+    for parameter in inspect.signature(listener).parameters.values():
+        if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            total_positional_args += 1
+        elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            has_variable_positional_args = True
+    return total_positional_args, has_variable_positional_args
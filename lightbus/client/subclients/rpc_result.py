@@ -81,7 +81,7 @@ class RpcResultClient(BaseSubClient):
 
         api_names = [api.meta.name for api in apis]
 
-        await self.producer.send(ConsumeRpcsCommand(api_names=api_names)).wait()
+        await self.producer.send_and_wait(ConsumeRpcsCommand(api_names=api_names))
 
     async def call_rpc_remote(
         self, api_name: str, name: str, kwargs: dict = frozendict(), options: dict = frozendict()
@@ -105,16 +105,16 @@ class RpcResultClient(BaseSubClient):
         result_queue = InternalQueue()
 
         # Send the RPC
-        await self.producer.send(
+        await self.producer.send_and_wait(
             commands.CallRpcCommand(message=rpc_message, options=options)
-        ).wait()
+        )
 
         # Start a listener which will wait for results
-        await self.producer.send(
+        await self.producer.send_and_wait(
             commands.ReceiveResultCommand(
                 message=rpc_message, destination_queue=result_queue, options=options
             )
-        ).wait()
+        )
 
         # Wait for the result from the listener we started.
         # The RpcResultDock will handle timeouts
@@ -203,10 +203,9 @@ class RpcResultClient(BaseSubClient):
 
     async def close(self):
         await super().close()
-        await self.producer.send(commands.CloseCommand()).wait()
+        await self.producer.send_and_wait(commands.CloseCommand())
 
         await self.consumer.close()
-        await self.producer.close()
 
     @singledispatchmethod
     async def handle(self, command):
@@ -247,6 +246,6 @@ class RpcResultClient(BaseSubClient):
         if not result_message.error:
             validate_outgoing(self.config, self.schema, result_message)
 
-        await self.producer.send(
+        await self.producer.send_and_wait(
             commands.SendResultCommand(message=result_message, rpc_message=command.message)
-        ).wait()
+        )
@@ -27,16 +27,18 @@ def _validate(
     if direction not in ("incoming", "outgoing"):
         raise AssertionError("Invalid direction specified")
 
-    # Result messages do not carry the api or procedure name, so allow them to be
-    # specified manually
     api_name = message.api_name
-    event_or_rpc_name = getattr(message, "procedure_name", None) or getattr(message, "event_name")
     api_config = config.api(api_name)
-    strict_validation = api_config.strict_validation
 
+    # Check this first, so there is as little overhead as possible when validation is disabled
     if not getattr(api_config.validate, direction):
         return
 
+    # Result messages do not carry the api or procedure name, so allow them to be
+    # specified manually
+    event_or_rpc_name = getattr(message, "procedure_name", None) or getattr(message, "event_name")
+    strict_validation = api_config.strict_validation
+
     if api_name not in schema:
         if strict_validation:
             raise UnknownApi(
@@ -1,6 +1,7 @@
 import argparse
 import logging
 import sys
+from typing import Optional
 
 import lightbus
 import lightbus.client
@@ -24,6 +25,9 @@ COMMAND_PARSED_ARGS = {}
 RED = "\033[91m" if sys.stdout.isatty() else ""
 RESET = "\033[0m" if sys.stdout.isatty() else ""
 
+# Config used by the temporary plugin registry in parse_args(). See _get_empty_config()
+_EMPTY_CONFIG: Optional[Config] = None
+
 
 def lightbus_entry_point():  # pragma: no cover
     sys.path.insert(0, "")
@@ -80,7 +84,7 @@ def parse_args(args=None):
 
     # Create a temporary plugin registry in order to run the before_parse_args hook
     plugin_registry = PluginRegistry()
-    plugin_registry.autoload_plugins(config=Config.load_dict({}))
+    plugin_registry.autoload_plugins(config=_get_empty_config())
 
     block(
         plugin_registry.execute_hook("before_parse_args", parser=parser, subparsers=subparsers),
@@ -93,6 +97,19 @@ def parse_args(args=None):
     return args
 
 
+def _get_empty_config() -> Config:
+    """Get an empty config, loading it upon first use
+
+    Loading config involves building the config's json schema and validating
+    against it. This is wasted effort when we are loading the same empty config
+    every time, so we only do it once per process.
+    """
+    global _EMPTY_CONFIG  # pylint: disable=global-statement
+    if _EMPTY_CONFIG is None:
+        _EMPTY_CONFIG = Config.load_dict({})
+    return _EMPTY_CONFIG
+
+
 def load_config(args) -> Config:
     return lightbus.creation.load_config(
         from_file=args.config_file,
@@ -9,6 +9,11 @@ __all__ = ["Message", "RpcMessage", "ResultMessage", "EventMessage"]
 class Message:
     """Base representation of a Lightbus RPC/Result/Event message"""
 
+    # Messages are created for every event fired & RPC called, so store the standard
+    # fields in slots. __dict__ is kept so other attributes can still be set on messages
+    # (it is only created if that actually happens)
+    __slots__ = ("id", "native_id", "__dict__", "__weakref__")
+
     required_metadata: Sequence
 
     def __init__(self, id: str = "", native_id: str = None):
@@ -41,6 +46,8 @@ class Message:
 class RpcMessage(Message):
     """Representation of a Lightbus RPC message"""
 
+    __slots__ = ("api_name", "procedure_name", "kwargs", "return_path")
+
     required_metadata = ["id", "api_name", "procedure_name", "return_path"]
 
     def __init__(
@@ -90,6 +97,8 @@ class RpcMessage(Message):
 class ResultMessage(Message):
     """Representation of a Lightbus RPC Result message"""
 
+    __slots__ = ("api_name", "procedure_name", "rpc_message_id", "result", "error", "trace")
+
     required_metadata = ["id", "rpc_message_id"]
 
     def __init__(
@@ -150,6 +159,8 @@ class ResultMessage(Message):
 class EventMessage(Message):
     """Representation of a Lightbus Event message"""
 
+    __slots__ = ("api_name", "event_name", "version", "kwargs")
+
     required_metadata = ["id", "api_name", "event_name", "version"]
 
     def __init__(
@@ -138,6 +138,8 @@ class MetricsPlugin(LightbusPlugin):
         kwargs.setdefault("process_name", self.process_name)
         kwargs = deform_to_bus(kwargs)
 
+        # Metrics are fire-and-forget, so don't hold up the caller
+        # while the event makes its way to the event transport
         return client.fire_event(
-            api_name="internal.metrics", name=event_name_, kwargs=kwargs, options={}
+            api_name="internal.metrics", name=event_name_, kwargs=kwargs, options={}, wait=False
         )
@@ -3,7 +3,7 @@ import json
 import logging
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Optional, TextIO, Union, ChainMap, List, Tuple, Dict, TYPE_CHECKING
+from typing import Optional, TextIO, Union, ChainMap, List, Tuple, Dict, Any, TYPE_CHECKING
 import asyncio
 import itertools
 import sys
@@ -70,6 +70,11 @@ class Schema:
         # remote schemas is mediated by the schema transport.
         self._remote_schemas: Optional[Dict[str, dict]] = None
 
+        # JSON schema validators, keyed by (api_name, event_or_rpc_name, 'parameters'/'response').
+        # Each is stored alongside the JSON schema it was created for, so we can tell
+        # if the schema has since been replaced (i.e. reloaded from the bus)
+        self._validators: Dict[Tuple[str, str, str], Tuple[dict, Any]] = {}
+
     def __contains__(self, item):
         return item in self.local_schemas or item in self.remote_schemas
 
@@ -137,7 +142,9 @@ class Schema:
         """
         json_schema = self.get_event_or_rpc_schema(api_name, event_or_rpc_name)["parameters"]
         try:
-            jsonschema.validate(parameters, json_schema)
+            self._validate_json(
+                parameters, json_schema, cache_key=(api_name, event_or_rpc_name, "parameters")
+            )
         except jsonschema.ValidationError as e:
             logger.error(e)
             path = list(e.absolute_path)
@@ -190,7 +197,7 @@ class Schema:
         """
         json_schema = self.get_rpc_schema(api_name, rpc_name)["response"]
         try:
-            jsonschema.validate(response, json_schema)
+            self._validate_json(response, json_schema, cache_key=(api_name, rpc_name, "response"))
         except jsonschema.ValidationError as e:
             logger.error(e)
             path = list(e.absolute_path)
@@ -220,6 +227,24 @@ class Schema:
                     f"The full validator error was logged above"
                 ) from None
 
+    def _validate_json(self, instance, json_schema: dict, cache_key: Tuple[str, str, str]):
+        """Validate the instance against the given JSON schema
+
+        Equivalent to `jsonschema.validate()`, but the validator (and the check
+        of the schema itself) is only created once for each schema, rather
+        than upon every validation.
+        """
+        cached = self._validators.get(cache_key)
+        if cached is None or cached[0] is not json_schema:
+            validator_class = jsonschema.validators.validator_for(json_schema)
+            validator_class.check_schema(json_schema)
+            cached = (json_schema, validator_class(json_schema))
+            self._validators[cache_key] = cached
+
+        error = jsonschema.exceptions.best_match(cached[1].iter_errors(instance))
+        if error is not None:
+            raise error
+
     @property
     def api_names(self) -> List[str]:
         return list(set(itertools.chain(self.local_schemas.keys(), self.remote_schemas.keys())))
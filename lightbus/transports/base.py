@@ -20,12 +20,31 @@ class TransportMetaclass(type):
     def __new__(mcs, name, bases, attrs, **kwds):
         cls = super().__new__(mcs, name, bases, attrs)
         if not hasattr(cls, f"{name}Config") and hasattr(cls, "from_config"):
-            cls.Config = make_from_config_structure(
-                class_name=name, from_config_method=cls.from_config
-            )
+            cls.Config = _LazyConfigStructure(cls)
         return cls
 
 
+class _LazyConfigStructure:
+    """Create a transport's Config structure upon first access
+
+    Many transport classes are defined but never used (base classes, transports
+    which are not configured). This avoids building a config structure for each one
+    at import time.
+    """
+
+    def __init__(self, transport_class: type):
+        self.transport_class = transport_class
+
+    def __get__(self, instance, owner):
+        config_structure = make_from_config_structure(
+            class_name=self.transport_class.__name__,
+            from_config_method=self.transport_class.from_config,
+        )
+        # Replace ourselves with the structure, so we are not called again
+        self.transport_class.Config = config_structure
+        return config_structure
+
+
 class Transport(metaclass=TransportMetaclass):
     @classmethod
     def from_config(cls: Type[T], config: "Config") -> T:
@@ -110,6 +129,15 @@ class EventTransport(Transport):
         """Publish an event"""
         raise NotImplementedError()
 
+    async def send_event_batch(self, event_messages: Sequence[EventMessage], options: dict):
+        """Publish multiple events
+
+        Defaults to calling send_event() for each event. Transports may
+        override this in order to send the events more efficiently.
+        """
+        for event_message in event_messages:
+            await self.send_event(event_message, options=options)
+
     async def consume(
         self, listen_for: List[Tuple[str, str]], listener_name: str, **kwargs
     ) -> AsyncGenerator[List[EventMessage], None]:
@@ -188,6 +188,48 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
             )
         )
 
+    async def send_event_batch(self, event_messages: Sequence[EventMessage], options: dict):
+        """Publish multiple events, using a single pipeline"""
+        # Prepare everything up-front, so any errors are raised before we start
+        # adding commands to the pipeline
+        stream_fields = []
+        for event_message in event_messages:
+            stream = self._get_stream_names(
+                listen_for=[(event_message.api_name, event_message.event_name)]
+            )[0]
+            stream_fields.append((stream, self.serializer(event_message)))
+
+            logger.debug(
+                LBullets(
+                    L(
+                        "Enqueuing event message {} in Redis stream {}",
+                        Bold(event_message),
+                        Bold(stream),
+                    ),
+                    items=dict(**event_message.get_metadata(), kwargs=event_message.get_kwargs()),
+                )
+            )
+
+        with await self.connection_manager() as redis:
+            start_time = time.time()
+            p = redis.pipeline()
+            for stream, fields in stream_fields:
+                p.xadd(
+                    stream=stream,
+                    fields=fields,
+                    max_len=self.max_stream_length or None,
+                    exact_len=False,
+                )
+            await p.execute()
+
+        logger.debug(
+            L(
+                "Enqueued {} event messages in Redis in {}",
+                len(event_messages),
+                human_time(time.time() - start_time),
+            )
+        )
+
     async def consume(
         self,
         listen_for: List[Tuple[str, str]],
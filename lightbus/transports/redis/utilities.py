@@ -80,6 +80,8 @@ class InvalidRedisPool(LightbusException):
 
 
 class RedisEventMessage(EventMessage):
+    __slots__ = ("stream", "consumer_group")
+
     def __init__(self, *, stream: str, native_id: str, consumer_group: Optional[str], **kwargs):
         super(RedisEventMessage, self).__init__(**kwargs)
         self.stream = stream
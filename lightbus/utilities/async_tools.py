@@ -58,13 +58,16 @@ async def cancel(*tasks):
     """Useful for cleaning up tasks in tests"""
     # pylint: disable=broad-except
     ex = None
-    for task in tasks:
-        if task is None:
-            continue
+    tasks = [task for task in tasks if task is not None]
 
-        # Cancel all the tasks any pull out any exceptions
+    # Cancel all the tasks up front. This way they all wind down concurrently,
+    # rather than us waiting for each one in turn before cancelling the next
+    for task in tasks:
         if not task.cancelled():
             task.cancel()
+
+    # Now wait for the tasks to finish, and pull out any exceptions
+    for task in tasks:
         try:
             await task
             task.result()
@@ -24,8 +24,18 @@ def cast_to_signature(parameters: dict, callable) -> dict:
 
     Will resolve functions which have been wrapped using itertools.wrap()
     """
+    return cast_to_type_hints(parameters, get_type_hints(callable))
+
+
+def cast_to_type_hints(parameters: dict, type_hints: Mapping[str, Any]) -> dict:
+    """Cast parameters into the given type hints
+
+    Fetching a callable's type hints is relatively expensive. Use this rather than
+    cast_to_signature() if you are going to cast parameters for the same callable
+    many times, and fetch the type hints once using `typing.get_type_hints()`.
+    """
     casted_parameters = parameters.copy()
-    for key, hint in get_type_hints(callable).items():
+    for key, hint in type_hints.items():
         if key not in casted_parameters:
             continue
 
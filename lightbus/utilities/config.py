@@ -3,7 +3,7 @@ import logging
 import secrets
 import string
 
-from typing import Type, NamedTuple  # pylint: disable=unused-import,cyclic-import
+from typing import Type, NamedTuple
 
 import itertools
 
@@ -17,10 +17,8 @@ def make_from_config_structure(class_name, from_config_method, extra_parameters=
     This is useful when dynamically creating the config structure for Transports
     and Plugins.
     """
-    # pylint: disable=exec-used
-
-    code = f"class {class_name}Config(NamedTuple):\n    pass\n"
-    variables = dict(p={})
+    fields = []
+    defaults = []
 
     parameters = inspect.signature(from_config_method).parameters.values()
     for parameter in itertools.chain(parameters, extra_parameters):
@@ -39,14 +37,19 @@ def make_from_config_structure(class_name, from_config_method, extra_parameters=
                 f"**kwargs-style parameters are not supported in from_config() on class {class_name}"
             )
         else:
-            name = parameter.name
-            variables["p"][name] = parameter
-            code += f"    {name}: p['{name}'].annotation = p['{name}'].default\n"
-
-    globals_ = globals().copy()
-    globals_.update(variables)
-    exec(code, globals_)  # nosec
-    return globals_[f"{class_name}Config"]
+            # Note that every field gets a default. Parameters without a
+            # default get inspect.Parameter.empty
+            fields.append((parameter.name, parameter.annotation))
+            defaults.append(parameter.default)
+
+    # The functional form of NamedTuple does not accept defaults, so set them
+    # in the same way as the class-based form does
+    config_structure = NamedTuple(f"{class_name}Config", fields)
+    config_structure.__new__.__defaults__ = tuple(defaults)
+    config_structure._field_defaults = {
+        name: default for (name, _), default in zip(fields, defaults)
+    }
+    return config_structure
 
 
 def random_name(length: int) -> str:
@@ -153,9 +153,16 @@ class InternalQueue(asyncio.Queue, Generic[T]):
         while waiters:
             waiter = waiters.popleft()
             if not waiter.done():
-                # We must set the result from within the waiter's
-                # original event loop, so use call_soon_threadsafe()
-                waiter.get_loop().call_soon_threadsafe(partial(waiter.set_result, None))
+                waiter_loop = waiter.get_loop()
+                if waiter_loop is asyncio._get_running_loop():
+                    # The waiter is on our own loop, so we can set the result
+                    # directly (as asyncio.Queue does) and avoid the cost
+                    # of call_soon_threadsafe()
+                    waiter.set_result(None)
+                else:
+                    # We must set the result from within the waiter's
+                    # original event loop, so use call_soon_threadsafe()
+                    waiter_loop.call_soon_threadsafe(partial(waiter.set_result, None))
                 break
 
     def task_done(self):
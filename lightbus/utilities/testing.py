@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from contextlib import ContextDecorator
 from functools import wraps
@@ -15,7 +14,8 @@ from lightbus import (
     ResultMessage,
     EventMessage,
 )
-from lightbus.client.commands import SendEventCommand, CallRpcCommand
+from lightbus.client.commands import SendEventCommand, SendEventBatchCommand, CallRpcCommand
+from lightbus.client.internal_messaging.consumer import OnDone
 from lightbus.config import Config
 from lightbus.path import BusPath
 from lightbus.client import BusClient
@@ -71,11 +71,17 @@ class MockResult:
     assert_event_not_fired = assertEventNotFired
 
     def getEventMessages(self, full_event_name=None) -> List[EventMessage]:
-        commands = self.mocker_context.event.to_transport.commands.get_all(SendEventCommand)
+        event_messages = []
+        for command in self.mocker_context.event.to_transport.commands:
+            if type(command) == SendEventCommand:
+                event_messages.append(command.message)
+            elif type(command) == SendEventBatchCommand:
+                event_messages.extend(command.messages)
+
         if full_event_name is None:
-            return [c.message for c in commands]
+            return event_messages
         else:
-            return [c.message for c in commands if c.message.canonical_name == full_event_name]
+            return [m for m in event_messages if m.canonical_name == full_event_name]
 
     get_event_messages = getEventMessages
 
@@ -364,8 +370,8 @@ Command = TypeVar("Command", bound=NamedTuple)
 class QueueMockContext:
     def __init__(self, queue: InternalQueue):
         self.queue = queue
-        self.put_items: List[Tuple[Command, asyncio.Event]] = []
-        self.got_items: List[Tuple[Command, asyncio.Event]] = []
+        self.put_items: List[Tuple[Command, OnDone]] = []
+        self.got_items: List[Tuple[Command, OnDone]] = []
 
         self._patched_put_nowait: Optional[_patch] = None
         self._patched_get_nowait: Optional[_patch] = None
@@ -22,9 +22,8 @@ async def producer():
     def _on_exception(e):
         raise e
 
-    producer = InternalProducer(queue=InternalQueue(), error_queue=InternalQueue())
+    producer = InternalProducer(queue=InternalQueue())
     yield producer
-    await producer.close()
 
 
 @pytest.fixture
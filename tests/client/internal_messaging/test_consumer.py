@@ -79,6 +79,70 @@ async def test_consume_on_done(consumer: InternalConsumer):
     assert consumer.queue.qsize() == 0
 
 
+@pytest.mark.asyncio
+async def test_consume_on_done_future(consumer: InternalConsumer, fake_coroutine):
+    consumer.start(fake_coroutine)
+
+    on_done = asyncio.get_event_loop().create_future()
+    consumer.queue.put_nowait((SendEventCommand(message=None), on_done))
+
+    await asyncio.wait_for(on_done, timeout=0.1)
+    assert on_done.result() is None
+
+
+@pytest.mark.asyncio
+async def test_consume_no_on_done(consumer: InternalConsumer):
+    """Commands sent without an on_done event should still be handled"""
+    calls = 0
+
+    async def fn(command):
+        nonlocal calls
+        calls += 1
+
+    consumer.start(fn)
+    consumer.queue.put_nowait((SendEventCommand(message=None), None))
+    await asyncio.sleep(0.05)
+
+    assert calls == 1
+    assert len(consumer._running_commands) == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_batch(consumer: InternalConsumer):
+    """Commands already waiting on the queue should be picked up in batches"""
+    calls = []
+
+    async def fn(command):
+        calls.append(command)
+
+    consumer.max_batch_size = 2
+
+    # Count how many times the consumer waits on the queue
+    get_calls = []
+    original_get = consumer.queue.get
+
+    async def get():
+        get_calls.append(None)
+        return await original_get()
+
+    consumer.queue.get = get
+
+    # Add the commands before starting, so they are all waiting on the queue
+    on_done_events = [asyncio.Event() for _ in range(5)]
+    for i, on_done in enumerate(on_done_events):
+        consumer.queue.put_nowait((i, on_done))
+
+    consumer.start(fn)
+    await asyncio.sleep(0.05)
+
+    assert all(on_done.is_set() for on_done in on_done_events)
+    assert calls == [0, 1, 2, 3, 4]
+    assert consumer.queue.qsize() == 0
+
+    # Three batches (of 2, 2 & 1 commands), plus the get() now waiting for more
+    assert len(get_calls) == 4
+
+
 @pytest.mark.asyncio
 async def test_consume_exception(consumer: InternalConsumer):
     exceptions = []
@@ -103,3 +167,55 @@ async def test_consume_exception(consumer: InternalConsumer):
 
     error: Error = consumer.error_queue.get_nowait()
     assert error.type == ValueError
+
+
+@pytest.mark.asyncio
+async def test_exception_in_handler_already_enqueued(consumer: InternalConsumer):
+    async def fn(command):
+        e = ValueError("Something went wrong")
+        e.enqueued = True
+        raise e
+
+    consumer.start(fn)
+
+    on_done = asyncio.Event()
+    consumer.queue.put_nowait((None, on_done))
+    await on_done.wait()
+
+    # The error has already been placed in the error queue by something else
+    assert consumer.error_queue.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_when_task_finished_unknown_task(consumer: InternalConsumer):
+    async def fn():
+        pass
+
+    # A task which the consumer is not tracking should not prevent
+    # the sender from being notified
+    task = asyncio.ensure_future(fn())
+    await task
+
+    on_done = asyncio.Event()
+    consumer._when_task_finished(on_done, task)
+    assert on_done.is_set()
+    assert not consumer._running_commands
+
+
+@pytest.mark.asyncio
+async def test_running_commands_tracked(consumer: InternalConsumer):
+    finish = asyncio.Event()
+
+    async def fn(command):
+        await finish.wait()
+
+    consumer.start(fn)
+
+    on_done = asyncio.Event()
+    consumer.queue.put_nowait((None, on_done))
+    await asyncio.sleep(0.01)
+    assert len(consumer._running_commands) == 1
+
+    finish.set()
+    await on_done.wait()
+    assert not consumer._running_commands
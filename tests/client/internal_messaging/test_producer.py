@@ -10,34 +10,28 @@ pytestmark = pytest.mark.unit
 
 
 @pytest.mark.asyncio
-async def test_queue_monitor(producer: InternalProducer, caplog: LogCaptureFixture, fake_coroutine):
-    """Ensure the queue monitor logs as we expect
+async def test_queue_size_warning(producer: InternalProducer, caplog: LogCaptureFixture):
+    """Ensure the queue size warnings are logged as we expect
 
-    Note that something we implicitly test for here is that the monitor
+    Note that something we implicitly test for here is that the producer
     does not log lots of duplicate lines. Rather it only logs when
     something changes.
+
+    The queue size is checked when the producer puts a command onto the queue,
+    so the queue shrinking is only reported upon the following put.
     """
     producer.size_warning = 3
-    producer.monitor_interval = 0.01
     caplog.set_level(logging.WARNING)
 
-    # Start the producer running
-    producer.start()
-
-    # No logging yet
-    assert not caplog.records
-
     # Add a couple of items to the queue (still under size_warning)
-    producer.queue.put_nowait(None)
-    producer.queue.put_nowait(None)
-    await asyncio.sleep(0.05)
+    producer.send_nowait(None)
+    producer.send_nowait(None)
 
-    # Still no logging yet
+    # No logging yet
     assert not caplog.records
 
     # One more gets us up to the warning level
-    producer.queue.put_nowait(None)
-    await asyncio.sleep(0.05)
+    producer.send_nowait(None)
 
     # Now we have logging
     assert len(caplog.records) == 1
@@ -45,8 +39,7 @@ async def test_queue_monitor(producer: InternalProducer, caplog: LogCaptureFixtu
     caplog.clear()  # Clear the log messages
 
     # Let's check we get another messages when the queue gets bigger again
-    producer.queue.put_nowait(None)
-    await asyncio.sleep(0.05)
+    producer.send_nowait(None)
 
     assert len(caplog.records) == 1
     assert caplog.records[0].getMessage() == "Queue in InternalProducer now has 4 commands."
@@ -54,7 +47,8 @@ async def test_queue_monitor(producer: InternalProducer, caplog: LogCaptureFixtu
 
     # Now check we get logging when the queue shrinks, but is still above the warning level
     producer.queue.get_nowait()
-    await asyncio.sleep(0.05)
+    producer.queue.get_nowait()
+    producer.send_nowait(None)
 
     assert len(caplog.records) == 1
     assert caplog.records[0].getMessage() == (
@@ -64,7 +58,8 @@ async def test_queue_monitor(producer: InternalProducer, caplog: LogCaptureFixtu
 
     # Now check we get logging when the queue shrinks to BELOW the warning level
     producer.queue.get_nowait()
-    await asyncio.sleep(0.05)
+    producer.queue.get_nowait()
+    producer.send_nowait(None)
 
     assert len(caplog.records) == 1
     assert caplog.records[0].getMessage() == (
@@ -72,3 +67,44 @@ async def test_queue_monitor(producer: InternalProducer, caplog: LogCaptureFixtu
         "Queue is now at an OK size again."
     )
     caplog.clear()  # Clear the log messages
+
+    # No further logging while the queue stays at an OK size
+    producer.queue.get_nowait()
+    producer.send_nowait(None)
+    assert not caplog.records
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait(producer: InternalProducer):
+    """Ensure send_and_wait() waits until the command has been handled"""
+    send_task = asyncio.ensure_future(producer.send_and_wait("command"))
+    await asyncio.sleep(0.01)
+    assert not send_task.done()
+
+    command, on_done = producer.queue.get_nowait()
+    assert command == "command"
+    assert isinstance(on_done, asyncio.Future)
+
+    on_done.set_result(None)
+    await asyncio.wait_for(send_task, timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_send_nowait(producer: InternalProducer):
+    producer.send_nowait("command")
+    assert producer.queue.get_nowait() == ("command", None)
+
+
+@pytest.mark.asyncio
+async def test_send(producer: InternalProducer):
+    """Ensure send() gives the consumer a Future, and sets the returned Event once it is done"""
+    event = producer.send("command")
+
+    command, on_done = producer.queue.get_nowait()
+    assert command == "command"
+    assert isinstance(on_done, asyncio.Future)
+    assert on_done.get_loop() is asyncio.get_event_loop()
+    assert not event.is_set()
+
+    on_done.set_result(None)
+    await asyncio.wait_for(event.wait(), timeout=0.1)
@@ -1,9 +1,11 @@
 import asyncio
 import logging
+from dataclasses import dataclass
+from functools import partial
 from unittest.mock import MagicMock
 
 import pytest
-from typing import Type
+from typing import Type, get_type_hints
 
 import lightbus
 import lightbus.creation
@@ -51,6 +53,80 @@ async def test_fire_event_bad_event_arguments(dummy_bus: lightbus.path.BusPath,
         await dummy_bus.client.fire_event("my.dummy", "my_event", kwargs={"bad_arg": "value"})
 
 
+@pytest.mark.asyncio
+async def test_fire_event_no_wait(
+    mocker, dummy_bus: lightbus.path.BusPath, dummy_api, queue_mocker: Type[BusQueueMockerContext],
+):
+    dummy_bus.client.register_api(dummy_api)
+    await dummy_bus.client.lazy_load_now()
+    mocker.spy(dummy_bus.client.hook_registry, "execute")
+
+    with queue_mocker(dummy_bus.client) as q:
+        await dummy_bus.client.fire_event("my.dummy", "my_event", kwargs={"field": "a"}, wait=False)
+
+    # The command is queued, but nothing will be notified when it is done
+    command, on_done = q.event.to_transport.put_items[0]
+    assert command.message.kwargs == {"field": "a"}
+    assert on_done is None
+
+    # The event has not necessarily been sent, so after_event_sent is not executed
+    hook_names = [c[0][0] for c in dummy_bus.client.hook_registry.execute.call_args_list]
+    assert hook_names == ["before_event_sent"]
+
+
+@pytest.mark.asyncio
+async def test_fire_event_message_factory_cached(
+    mocker, dummy_bus: lightbus.path.BusPath, dummy_api
+):
+    dummy_bus.client.register_api(dummy_api)
+    event_client = dummy_bus.client.event_client
+    mocker.spy(event_client, "_build_event_message_factory")
+
+    await dummy_bus.client.fire_event("my.dummy", "my_event", kwargs={"field": "a"})
+    await dummy_bus.client.fire_event("my.dummy", "my_event", kwargs={"field": "b"})
+    assert event_client._build_event_message_factory.call_count == 1
+
+    # Replacing the API in the registry causes the factory to be rebuilt
+    dummy_bus.client.register_api(dummy_api.__class__())
+    await dummy_bus.client.fire_event("my.dummy", "my_event", kwargs={"field": "c"})
+    assert event_client._build_event_message_factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fire_events(mocker, dummy_bus: lightbus.path.BusPath, dummy_api):
+    dummy_bus.client.register_api(dummy_api)
+    event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+    mocker.spy(event_transport, "send_event_batch")
+
+    events = [
+        ("my.dummy", "my_event", {"field": "a"}),
+        ("my.dummy", "my_event", {"field": "b"}),
+    ]
+    await dummy_bus.client.fire_events(events)
+
+    # Both events are sent to the transport in a single call
+    assert event_transport.send_event_batch.call_count == 1
+    event_messages = event_transport.send_event_batch.call_args[1]["event_messages"]
+    assert [m.kwargs["field"] for m in event_messages] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_fire_events_bad_event_arguments(mocker, dummy_bus: lightbus.path.BusPath, dummy_api):
+    dummy_bus.client.register_api(dummy_api)
+    event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+    mocker.spy(event_transport, "send_event_batch")
+
+    events = [
+        ("my.dummy", "my_event", {"field": "a"}),
+        ("my.dummy", "my_event", {"bad_arg": "value"}),
+    ]
+    with pytest.raises(InvalidEventArguments):
+        await dummy_bus.client.fire_events(events)
+
+    # Nothing should be sent if any of the events are invalid
+    assert event_transport.send_event_batch.call_count == 0
+
+
 @pytest.mark.asyncio
 async def test_listen_for_event_non_callable(dummy_bus: lightbus.path.BusPath):
     with pytest.raises(InvalidEventListener):
@@ -96,6 +172,71 @@ async def test_listen_for_event_variable_positional_args(dummy_bus: lightbus.pat
     )
 
 
+@pytest.mark.asyncio
+async def test_listen_for_event_method(dummy_bus: lightbus.path.BusPath):
+    class Listeners:
+        def no_args(self):
+            pass
+
+        def one_arg(self, event_message):
+            pass
+
+    with pytest.raises(InvalidEventListener):
+        dummy_bus.client.listen_for_event(
+            "my.dummy", "my_event", listener=Listeners().no_args, listener_name="test1"
+        )
+
+    dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener=Listeners().one_arg, listener_name="test2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_partial(dummy_bus: lightbus.path.BusPath):
+    def fn(a, event_message):
+        pass
+
+    with pytest.raises(InvalidEventListener):
+        dummy_bus.client.listen_for_event(
+            "my.dummy",
+            "my_event",
+            listener=partial(fn, 1, event_message=None),
+            listener_name="test1",
+        )
+
+    dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener=partial(fn, 1), listener_name="test2"
+    )
+
+
+def test_get_type_hints_cached(dummy_bus: lightbus.path.BusPath):
+    def listener(event_message, field: int):
+        pass
+
+    event_client = dummy_bus.client.event_client
+    type_hints = event_client._get_type_hints(listener)
+    assert type_hints == {"field": int}
+    assert listener in event_client._listener_type_hints
+
+    # The same hints are returned, rather than being fetched again
+    assert event_client._get_type_hints(listener) is type_hints
+
+
+def test_get_type_hints_unhashable_listener(dummy_bus: lightbus.path.BusPath):
+    # Dataclasses are unhashable by default
+    @dataclass
+    class Listener:
+        multiplier: int
+
+        def __call__(self, event_message, field):
+            pass
+
+    listener = Listener(multiplier=2)
+    event_client = dummy_bus.client.event_client
+    assert event_client._get_type_hints(listener) == get_type_hints(listener)
+    assert event_client._get_type_hints(listener) == get_type_hints(listener)
+
+
 @pytest.mark.asyncio
 async def test_listen_for_event_starts_with_underscore(dummy_bus: lightbus.path.BusPath):
     with pytest.raises(InvalidName):
@@ -1,6 +1,5 @@
 from typing import NamedTuple
 
-import jsonschema
 import pytest
 
 import lightbus
@@ -39,8 +38,8 @@ def create_bus_client_with_unhappy_schema(mocker, dummy_bus):
         # Make sure the test api named "api" has a schema, otherwise strict_validation
         # will fail it
         schema.local_schemas["api"] = fake_schema
-        mocker.patch(
-            "jsonschema.validate", autospec=True, side_effect=ValidationError("test error")
+        mocker.patch.object(
+            schema, "_validate_json", autospec=True, side_effect=ValidationError("test error")
         ),
         dummy_bus.client.schema = schema
         dummy_bus.client.config = config
@@ -57,7 +56,9 @@ def test_rpc_validate_incoming(create_bus_client_with_unhappy_schema):
     message = RpcMessage(api_name="api", procedure_name="proc", kwargs={"p": 1})
     with pytest.raises(ValidationError):
         validate_outgoing(config=client.config, schema=client.schema, message=message)
-    jsonschema.validate.assert_called_with({"p": 1}, {"p": {}})
+    client.schema._validate_json.assert_called_with(
+        {"p": 1}, {"p": {}}, cache_key=("api", "proc", "parameters")
+    )
 
 
 @pytest.mark.asyncio
@@ -69,7 +70,9 @@ def test_result_validate(create_bus_client_with_unhappy_schema):
     )
     with pytest.raises(ValidationError):
         validate_outgoing(config=client.config, schema=client.schema, message=message)
-    jsonschema.validate.assert_called_with("123", {})
+    client.schema._validate_json.assert_called_with(
+        "123", {}, cache_key=("api", "proc", "response")
+    )
 
 
 @pytest.mark.asyncio
@@ -79,7 +82,9 @@ def test_event_validate(create_bus_client_with_unhappy_schema):
     message = EventMessage(api_name="api", event_name="proc", kwargs={"p": 1})
     with pytest.raises(ValidationError):
         validate_outgoing(config=client.config, schema=client.schema, message=message)
-    jsonschema.validate.assert_called_with({"p": 1}, {"p": {}})
+    client.schema._validate_json.assert_called_with(
+        {"p": 1}, {"p": {}}, cache_key=("api", "proc", "parameters")
+    )
 
 
 @pytest.mark.asyncio
@@ -407,6 +407,27 @@ async def test_validate_response_invalid(schema, TestApi):
         schema.validate_response("my.test_api", "my_proc", 123)
 
 
+@pytest.mark.asyncio
+async def test_validate_validator_cached(schema, TestApi):
+    await schema.add_api(TestApi())
+    await schema.load_from_bus()
+    cache_key = ("my.test_api", "my_event", "parameters")
+
+    schema.validate_parameters("my.test_api", "my_event", {"field": True})
+    validator = schema._validators[cache_key][1]
+
+    with pytest.raises(ValidationError):
+        schema.validate_parameters("my.test_api", "my_event", {"field": 123})
+    assert schema._validators[cache_key][1] is validator
+
+    # Replacing the schema causes the validator to be recreated
+    schema.local_schemas["my.test_api"] = json.loads(
+        json.dumps(schema.local_schemas["my.test_api"])
+    )
+    schema.validate_parameters("my.test_api", "my_event", {"field": True})
+    assert schema._validators[cache_key][1] is not validator
+
+
 # Test validation error message types
 
 
@@ -1,6 +1,6 @@
 import pytest
 
-from lightbus import Api, Event
+from lightbus import Api, Event, Parameter
 from lightbus.api import ApiRegistry
 from lightbus.exceptions import (
     MisconfiguredApiOptions,
@@ -112,3 +112,10 @@ def test_api_registry_names(SimpleApi, registry):
     api = SimpleApi()
     registry.add(api)
     assert registry.names() == ["simple.api"]
+
+
+def test_event_parameter_names():
+    event = Event(parameters=["a", Parameter("b", str)])
+    assert event.parameter_names == {"a", "b"}
+    # Cached after the first access
+    assert event.parameter_names is event.parameter_names
@@ -0,0 +1,38 @@
+import pytest
+
+from lightbus import EventMessage, RpcMessage, ResultMessage
+from lightbus.transports.redis.utilities import RedisEventMessage
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "make_message",
+    [
+        lambda: EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+        lambda: RpcMessage(api_name="my.api", procedure_name="my_proc", kwargs={"field": "value"}),
+        lambda: ResultMessage(
+            result="value", api_name="my.api", procedure_name="my_proc", rpc_message_id="123"
+        ),
+        lambda: RedisEventMessage(
+            api_name="my.api",
+            event_name="my_event",
+            stream="my.api.my_event:stream",
+            native_id="1-0",
+            consumer_group=None,
+        ),
+    ],
+    ids=["event", "rpc", "result", "redis_event"],
+)
+def test_message_slots(make_message):
+    message = make_message()
+
+    # Standard fields are stored in slots, not in the instance dict
+    assert message.api_name == "my.api"
+    assert message.id
+    assert message.__dict__ == {}
+
+    # Arbitrary attributes can still be set (the debug transport sets 'datetime')
+    message.foo = "bar"
+    assert message.foo == "bar"
+    assert message.__dict__ == {"foo": "bar"}
@@ -1,7 +1,7 @@
 import pytest
 
 from lightbus import EventMessage, RpcMessage
-from lightbus.client.commands import SendEventCommand, CallRpcCommand
+from lightbus.client.commands import SendEventCommand, SendEventBatchCommand, CallRpcCommand
 from lightbus.utilities import testing
 from lightbus.utilities.testing import BusQueueMockerContext
 
@@ -77,6 +77,29 @@ def test_mock_result_assert_events_fired_times(mock_result: testing.MockResult,
         assert_events_fired("api.event", times=3)
 
 
+def test_mock_result_get_event_messages_batch(mock_result: testing.MockResult):
+    mock_result.mocker_context.event.to_transport.put_items = [
+        (
+            SendEventCommand(message=EventMessage(api_name="api", event_name="event"), options={}),
+            None,
+        ),
+        (
+            SendEventBatchCommand(
+                messages=[
+                    EventMessage(api_name="api", event_name="event"),
+                    EventMessage(api_name="api", event_name="other_event"),
+                ],
+                options={},
+            ),
+            None,
+        ),
+    ]
+
+    assert len(mock_result.get_event_messages()) == 3
+    assert len(mock_result.get_event_messages("api.event")) == 2
+    mock_result.assert_events_fired("api.other_event", times=1)
+
+
 @pytest.mark.parametrize(
     "method_name", ["assert_events_fired", "assertEventFired"], ids=["snake", "camel"]
 )
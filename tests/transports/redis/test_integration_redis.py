@@ -3,7 +3,6 @@ import logging
 from typing import Type
 from unittest.mock import MagicMock
 
-import jsonschema
 import pytest
 
 import lightbus
@@ -250,7 +249,7 @@ async def test_validation_rpc(loop, bus: lightbus.path.BusPath, dummy_api, mocke
     bus.client.register_api(dummy_api)
     config = Config.load_dict({"apis": {"default": {"validate": True, "strict_validation": True}}})
     bus.client.config = config
-    mocker.patch("jsonschema.validate", autospec=True)
+    mocker.patch.object(bus.client.schema, "_validate_json", autospec=True)
 
     async def co_consume_rpcs():
         return await bus.client.consume_rpcs(apis=[dummy_api])
@@ -269,13 +268,14 @@ async def test_validation_rpc(loop, bus: lightbus.path.BusPath, dummy_api, mocke
     assert result == "value: Hello"
 
     # Validate gets called
-    jsonschema.validate.assert_called_with(
+    bus.client.schema._validate_json.assert_called_with(
         "value: Hello",
         {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "title": "RPC my.dummy.my_proc() response",
             "type": "string",
         },
+        cache_key=("my.dummy", "my_proc", "response"),
     )
 
 
@@ -287,7 +287,7 @@ async def test_validation_event(
     bus.client.register_api(dummy_api)
     config = Config.load_dict({"apis": {"default": {"validate": True, "strict_validation": True}}})
     bus.client.config = config
-    mocker.patch("jsonschema.validate", autospec=True)
+    mocker.patch.object(bus.client.schema, "_validate_json", autospec=True)
 
     async def co_listener(*a, **kw):
         pass
@@ -304,7 +304,7 @@ async def test_validation_event(
         await asyncio.sleep(0.001)
 
     # Validate gets called
-    jsonschema.validate.assert_called_with(
+    bus.client.schema._validate_json.assert_called_with(
         {"field": "Hello"},
         {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -314,6 +314,7 @@ async def test_validation_event(
             "required": ["field"],
             "title": "Event my.dummy.my_event parameters",
         },
+        cache_key=("my.dummy", "my_event", "parameters"),
     )
 
 
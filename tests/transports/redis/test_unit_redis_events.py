@@ -66,6 +66,56 @@ async def test_send_event_per_api_stream(redis_event_transport: RedisEventTransp
     }
 
 
+@pytest.mark.asyncio
+async def test_send_event_batch(redis_event_transport: RedisEventTransport, redis_client):
+    await redis_event_transport.send_event_batch(
+        [
+            EventMessage(api_name="my.api", event_name="my_event", id="1", kwargs={"field": "a"}),
+            EventMessage(api_name="my.api", event_name="my_event", id="2", kwargs={"field": "b"}),
+            EventMessage(api_name="my.api", event_name="other_event", id="3", kwargs={}),
+        ],
+        options={},
+    )
+    messages = await redis_client.xrange("my.api.my_event:stream")
+    assert len(messages) == 2
+    assert [m[1][b"id"] for m in messages] == [b"1", b"2"]
+
+    messages = await redis_client.xrange("my.api.other_event:stream")
+    assert len(messages) == 1
+    assert messages[0][1][b"id"] == b"3"
+
+
+@pytest.mark.asyncio
+async def test_send_event_batch_serializer_error(
+    redis_event_transport: RedisEventTransport, redis_client, mocker
+):
+    class SerializerError(Exception):
+        pass
+
+    serializer = redis_event_transport.serializer
+
+    def fail_on_second(event_message):
+        if event_message.id == "2":
+            raise SerializerError()
+        return serializer(event_message)
+
+    mocker.patch.object(redis_event_transport, "serializer", side_effect=fail_on_second)
+    mocker.spy(redis_event_transport, "connection_manager")
+
+    with pytest.raises(SerializerError):
+        await redis_event_transport.send_event_batch(
+            [
+                EventMessage(api_name="my.api", event_name="my_event", id="1", kwargs={}),
+                EventMessage(api_name="my.api", event_name="my_event", id="2", kwargs={}),
+            ],
+            options={},
+        )
+
+    # The error is raised before any connection is made, and nothing is sent
+    assert redis_event_transport.connection_manager.call_count == 0
+    assert await redis_client.xrange("my.api.my_event:stream") == []
+
+
 @pytest.mark.asyncio
 async def test_consume_events_simple(
     redis_event_transport: RedisEventTransport, redis_client, error_queue
@@ -240,3 +240,20 @@ def test_get_transport_name():
 
     with pytest.raises(TransportNotFound):
         get_transport_name(FakeTransport)
+
+
+def test_transport_config_created_lazily(mocker):
+    from lightbus.transports import base
+
+    make_from_config_structure = mocker.spy(base, "make_from_config_structure")
+
+    class MyTransport(base.EventTransport):
+        @classmethod
+        def from_config(cls, config, foo: str = "bar"):
+            return cls()
+
+    # Config structure is not created until it is needed
+    assert make_from_config_structure.call_count == 0
+    assert MyTransport.Config().foo == "bar"
+    assert MyTransport.Config(foo="baz").foo == "baz"
+    assert make_from_config_structure.call_count == 1
@@ -47,6 +47,31 @@ def test_block_outside_event_loop():
     assert result == 1
 
 
+@pytest.mark.asyncio
+async def test_cancel_concurrently():
+    """Tasks should be cancelled together, not one after the other"""
+    history = []
+
+    async def slow_to_cancel(n):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            history.append(("cancelling", n))
+            await asyncio.sleep(0.01)
+            history.append(("cancelled", n))
+            raise
+
+    tasks = [asyncio.ensure_future(slow_to_cancel(n)) for n in range(5)]
+    await asyncio.sleep(0.001)
+
+    await cancel(*tasks)
+    assert all(task.cancelled() for task in tasks)
+
+    # Every task started being cancelled before any of them finished
+    assert [event for event, _ in history[:5]] == ["cancelling"] * 5
+    assert [event for event, _ in history[5:]] == ["cancelled"] * 5
+
+
 @pytest.fixture()
 async def run_for():
     async def run_for_inner(coroutine, seconds):
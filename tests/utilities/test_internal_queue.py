@@ -63,6 +63,21 @@ async def test_internal_queue_get_delay():
     assert task.result() is True
 
 
+@pytest.mark.asyncio
+async def test_internal_queue_get_delay_same_loop(mocker):
+    """Waking a getter on the same loop should not need call_soon_threadsafe()"""
+    queue = InternalQueue()
+    task = asyncio.create_task(queue.get())
+    await asyncio.sleep(0.001)
+
+    call_soon_threadsafe = mocker.spy(asyncio.get_event_loop(), "call_soon_threadsafe")
+    queue.put_nowait(True)
+    await asyncio.sleep(0.001)
+    assert task.done()
+    assert task.result() is True
+    assert not call_soon_threadsafe.called
+
+
 @pytest.mark.asyncio
 async def test_internal_queue_put_delay():
     queue = InternalQueue(maxsize=1)
@@ -9,7 +9,7 @@ from uuid import UUID
 import pytest
 from dataclasses import dataclass
 
-from lightbus.utilities.casting import cast_to_signature, cast_to_hint
+from lightbus.utilities.casting import cast_to_signature, cast_to_hint, cast_to_type_hints
 from lightbus.utilities.frozendict import frozendict
 
 pytestmark = pytest.mark.unit
@@ -47,6 +47,14 @@ def test_cast_to_signature_no_annotations():
     assert casted == {"a": "1", "b": 2, "c": obj}
 
 
+def test_cast_to_type_hints():
+    obj = object()
+    casted = cast_to_type_hints(
+        type_hints={"a": int, "b": str}, parameters={"a": "1", "b": 2, "c": obj}
+    )
+    assert casted == {"a": 1, "b": "2", "c": obj}
+
+
 class SimpleNamedTuple(NamedTuple):
     a: str
     b: int
@@ -0,0 +1,35 @@
+import inspect
+
+import pytest
+
+from lightbus.schema.schema import Parameter
+from lightbus.utilities.config import make_from_config_structure
+
+pytestmark = pytest.mark.unit
+
+
+def test_make_from_config_structure():
+    def from_config(config, a: int, b: str = "x", *, c=None):
+        pass
+
+    structure = make_from_config_structure(
+        class_name="Test",
+        from_config_method=from_config,
+        extra_parameters=[Parameter("enabled", bool, default=False)],
+    )
+
+    assert structure.__name__ == "TestConfig"
+    assert structure._fields == ("a", "b", "c", "enabled")
+    assert structure.__annotations__ == {
+        "a": int,
+        "b": str,
+        "c": inspect.Parameter.empty,
+        "enabled": bool,
+    }
+    assert structure._field_defaults == {
+        "a": inspect.Parameter.empty,
+        "b": "x",
+        "c": None,
+        "enabled": False,
+    }
+    assert structure(a=1) == (1, "x", None, False)